@@ -316,8 +316,20 @@ def main(page: ft.Page):
                                                         slide.get('text', '')))
 
                 try:
-                    translated_slides = translate_texts(slides_data, lang_code,
-                                                        progress_callback=lambda msg: add_log(msg))
+                    translation_records = translate_texts(slides_data, lang_code,
+                                                          progress_callback=lambda msg: add_log(msg))
+                    # Records are lightweight (slide_number + translations only);
+                    # fold them back into the slide dicts by slide_number
+                    records_by_number = {rec.slide_number: rec for rec in translation_records}
+                    for idx, slide in enumerate(slides_data):
+                        rec = records_by_number.get(slide.get('slide_number', idx + 1))
+                        if rec is None:
+                            continue
+                        slide['translated_text'] = rec.translated_text
+                        slide['translated_blocks'] = rec.translated_blocks
+                        if rec.translation_error:
+                            slide['translation_error'] = rec.translation_error
+                    translated_slides = slides_data
                 except Exception as e:
                     add_log(f"⚠ Translation failed: {str(e)}", COLOR_ERROR)
                     translated_slides = slides_data
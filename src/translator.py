@@ -1,39 +1,129 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+import asyncio
+import functools
+import hashlib
+import logging
+import random
+import re
+import sqlite3
 import time
+import traceback
 import os
+import importlib
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv # NEW: Import dotenv
 
+logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:%(message)s")
+logger = logging.getLogger(__name__)
+
 # NEW: Load .env from the same directory as this script
 load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
 
+# Full tracebacks walk and format the whole stack — too slow for the hot
+# error path during rate-limit floods, so only emit them on demand
+DEBUG = os.environ.get('PPTX_DEBUG') == '1'
+
 # Priority order: DeepL (best quality) -> deep-translator (free) -> googletrans (fallback)
-DEEPL_AVAILABLE = False
-DEEP_TRANSLATOR_AVAILABLE = False
-GOOGLETRANS_AVAILABLE = False
-
-try:
-    import deepl
-    DEEPL_AVAILABLE = True
-    print("✓ DeepL translator loaded (premium quality)")
-except ImportError:
-    print("✗ DeepL not installed (pip install deepl)")
-
-try:
-    from deep_translator import GoogleTranslator
-    DEEP_TRANSLATOR_AVAILABLE = True
-    print("✓ deep-translator loaded (Google Translate)")
-except ImportError:
-    print("✗ deep-translator not installed (pip install deep-translator)")
-
-try:
-    from googletrans import Translator
-    GOOGLETRANS_AVAILABLE = True
-    print("✓ googletrans loaded (fallback)")
-except (ImportError, AttributeError) as e:
-    # googletrans has compatibility issues with newer httpcore versions
-    print(f"✗ googletrans not available (compatibility issue: {type(e).__name__})")
+#
+# The translator SDKs drag in requests/httpx and cost hundreds of ms to
+# import, so only check that they exist here and import them on first use.
+def _module_available(name):
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+DEEPL_AVAILABLE = _module_available('deepl')
+DEEP_TRANSLATOR_AVAILABLE = _module_available('deep_translator')
+GOOGLETRANS_AVAILABLE = _module_available('googletrans')
+# Optional: lets us skip slides that are already in the target language
+LANGDETECT_AVAILABLE = _module_available('langdetect')
+
+_deepl_mod = None
+_deep_translator_mod = None
+_googletrans_mod = None
+_langdetect_mod = None
+
+
+def _get_deepl():
+    global _deepl_mod
+    if _deepl_mod is None:
+        _deepl_mod = importlib.import_module('deepl')
+    return _deepl_mod
+
+
+def _get_deep_translator():
+    global _deep_translator_mod
+    if _deep_translator_mod is None:
+        _deep_translator_mod = importlib.import_module('deep_translator')
+    return _deep_translator_mod
 
 
+def _get_googletrans():
+    # NOTE: may raise AttributeError with newer httpcore versions; callers
+    # already wrap this branch in try/except
+    global _googletrans_mod
+    if _googletrans_mod is None:
+        _googletrans_mod = importlib.import_module('googletrans')
+    return _googletrans_mod
+
+
+def _get_langdetect():
+    global _langdetect_mod
+    if _langdetect_mod is None:
+        _langdetect_mod = importlib.import_module('langdetect')
+    return _langdetect_mod
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    acquire() sleeps only for the exact time until the next token is
+    available, instead of a fixed delay after every request.
+    """
+
+    def __init__(self, capacity, refill_per_sec):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.refill_per_sec)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.refill_per_sec
+            time.sleep(wait_time)
+
+    def drain(self):
+        """Empty the bucket (e.g. after a rate-limit response) so every
+        worker waits a full refill interval before the next request."""
+        with self._lock:
+            self.tokens = 0
+            self.updated = time.monotonic()
+
+
+# (capacity, refill per second) per engine — DeepL Pro sustains ~10 req/s,
+# the free Google endpoints only ~1 request every 3 seconds
+RATE_LIMITS = {
+    "DeepL (Premium)": (10, 10),
+    "Google Translate (Free)": (1, 0.33),
+    "googletrans (Fallback)": (1, 0.33),
+}
+
+
+@functools.lru_cache(maxsize=1)
 def get_deepl_api_key():
     """Get DeepL API key from environment variables (loaded from .env)."""
     # Simply return the key from the environment
@@ -41,10 +131,150 @@ def get_deepl_api_key():
     return os.environ.get('DEEPL_API_KEY')
 
 
-def translate_texts(slides_data: List[Dict], target_lang: str, progress_callback=None) -> List[Dict]:
+# On-disk translation cache so re-translating the same deck (e.g. after small
+# edits) becomes local lookups instead of full API cost
+_CACHE_DB_PATH = os.path.expanduser('~/.pptx_translator_cache.db')
+
+
+def _cache_key(engine_name, target_lang, text):
+    return hashlib.blake2b(f"{engine_name}|{target_lang}|{text}".encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+
+def _open_translation_cache():
+    """Open (creating if needed) the persistent cache. Returns None on failure."""
+    try:
+        conn = sqlite3.connect(_CACHE_DB_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, translation TEXT)"
+        )
+        return conn
+    except Exception as e:
+        print(f"⚠ Translation cache unavailable ({e}), continuing without it")
+        return None
+
+
+_http_session = None
+
+
+def _get_http_session():
+    """Shared pooled requests.Session so every call reuses warm TCP+TLS connections.
+
+    Without this each short translation request pays a fresh TCP+TLS handshake,
+    which dominates latency on small payloads.
+    """
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _http_session = session
+    return _http_session
+
+
+@dataclass(slots=True)
+class TranslatedSlide:
+    """Lightweight per-slide translation result.
+
+    Only carries what translation produced — callers merge it back into their
+    slide dicts by slide_number instead of us copying every slide dict here.
+    """
+    slide_number: int
+    translated_text: str = ''
+    translated_blocks: List[str] = field(default_factory=list)
+    translation_error: Optional[str] = None
+
+
+def _classify_error(exc):
+    """Classify a translation failure as 'fatal' or 'retryable'.
+
+    Fatal errors (bad API key, exhausted quota) can't be fixed by retrying —
+    a 100-slide deck with an invalid key would otherwise burn the full
+    retry/backoff budget on every batch before finishing.
+    """
+    if DEEPL_AVAILABLE:
+        try:
+            deepl_exceptions = _get_deepl().exceptions
+            if isinstance(exc, (deepl_exceptions.AuthorizationException,
+                                deepl_exceptions.QuotaExceededException)):
+                return 'fatal'
+        except (ImportError, AttributeError):
+            pass
+    # requests.HTTPError and friends carry the response
+    status_code = getattr(getattr(exc, 'response', None), 'status_code', None)
+    if status_code in (401, 403):
+        return 'fatal'
+    if status_code in (429, 500, 502, 503, 504):
+        return 'retryable'
+    error_text = str(exc).lower()
+    if any(marker in error_text for marker in
+           ('unauthorized', 'forbidden', 'quota exceeded', 'invalid api key')):
+        return 'fatal'
+    return 'retryable'
+
+
+# Pure punctuation/numbers/whitespace — nothing a translator could change
+_NON_TRANSLATABLE_RE = re.compile(r'^[\W\d_\s]+$')
+
+
+# Rare sentinel the providers pass through verbatim; used to pack many short
+# texts into one payload and split the translation back apart
+_PACK_SEP_CORE = "⟦∎⟧"
+_PACK_SEP = f"\n{_PACK_SEP_CORE}\n"
+_PACK_MAX_CHARS = 3800
+
+
+def _pack_translate(texts, translate_func):
+    """Translate many short texts in few API calls via sentinel packing.
+
+    Greedily joins texts with _PACK_SEP into payloads of up to ~4 KB,
+    translates each payload once, and splits the result on the sentinel.
+    If the provider dropped a separator (part count mismatch), that group
+    falls back to one call per text.
+    """
+    results = []
+    group = []
+    group_chars = 0
+
+    def flush():
+        if not group:
+            return
+        if len(group) == 1:
+            results.append(translate_func(group[0]))
+            return
+        translated = translate_func(_PACK_SEP.join(group))
+        parts = [part.strip() for part in translated.split(_PACK_SEP_CORE)]
+        if len(parts) == len(group):
+            results.extend(parts)
+        else:
+            # Separator didn't survive translation — redo this group per text
+            results.extend(translate_func(text) for text in group)
+
+    for text in texts:
+        if group and group_chars + len(_PACK_SEP) + len(text) > _PACK_MAX_CHARS:
+            flush()
+            group = []
+            group_chars = 0
+        group.append(text)
+        group_chars += len(text) + (len(_PACK_SEP) if len(group) > 1 else 0)
+    flush()
+
+    return results
+
+
+def iter_translate_texts(slides_data: List[Dict], target_lang: str, progress_callback=None):
     """
     Translates slide texts (including AI narrations) to the target language.
 
+    Generator: yields one TranslatedSlide record per input slide, in slide
+    order, as soon as all of a slide's texts have been resolved — so a caller
+    can start writing audio/video output while later batches are still in
+    flight, and the full deck never has to sit in memory at once.
+
     NOW PROPERLY HANDLES:
     - ai_narration field (primary text to translate)
     - Falls back to 'text' field if ai_narration is missing
@@ -63,11 +293,20 @@ def translate_texts(slides_data: List[Dict], target_lang: str, progress_callback
                     'ko': 'KO', 'zh': 'ZH'
                 }
                 deepl_target = deepl_lang_map.get(target_lang.lower(), target_lang.upper())
-                translator = deepl.Translator(api_key)
+                deepl = _get_deepl()
+                try:
+                    translator = deepl.Translator(api_key, session=_get_http_session())
+                except TypeError:
+                    # Older deepl SDKs don't take a session; they pool internally
+                    translator = deepl.Translator(api_key)
 
-                def translate_func(text):
-                    result = translator.translate_text(text, target_lang=deepl_target)
-                    return result.text
+                # Default-arg binding: no global/closure lookups per call
+                def translate_func(text, _translate=translator.translate_text, _target=deepl_target):
+                    return _translate(text, target_lang=_target).text
+
+                def translate_batch_func(texts, _translate=translator.translate_text, _target=deepl_target):
+                    # DeepL natively accepts a list of texts (up to 50 / 76 KiB per request)
+                    return [r.text for r in _translate(texts, target_lang=_target)]
 
                 engine_name = "DeepL (Premium)"
                 print(f"✓ Using DeepL translator (target: {deepl_target})")
@@ -79,9 +318,14 @@ def translate_texts(slides_data: List[Dict], target_lang: str, progress_callback
 
     if translator is None and DEEP_TRANSLATOR_AVAILABLE:
         try:
-            translator_obj = GoogleTranslator(source='auto', target=target_lang)
+            translator_obj = _get_deep_translator().GoogleTranslator(source='auto', target=target_lang)
             translator = translator_obj  # FIX: Set translator so next check passes
-            translate_func = lambda text: translator_obj.translate(text)
+            # Swap in the pooled session when the backend keeps one (keep-alive)
+            if hasattr(translator_obj, '_session'):
+                translator_obj._session = _get_http_session()
+            # Bound methods: no extra lambda frame per call
+            translate_func = translator_obj.translate
+            translate_batch_func = translator_obj.translate_batch
             engine_name = "Google Translate (Free)"
             print(f"✓ Using deep-translator (Google Translate)")
             if progress_callback:
@@ -92,9 +336,14 @@ def translate_texts(slides_data: List[Dict], target_lang: str, progress_callback
 
     if translator is None and GOOGLETRANS_AVAILABLE:
         try:
-            translator_obj = Translator()
+            translator_obj = _get_googletrans().Translator()
             translator = translator_obj  # FIX: Set translator so next check passes
-            translate_func = lambda text: translator_obj.translate(text, dest=target_lang).text
+            def translate_func(text, _translate=translator_obj.translate, _dest=target_lang):
+                return _translate(text, dest=_dest).text
+
+            # googletrans has no batch endpoint; pack short texts into few calls
+            def translate_batch_func(texts, _translate_func=translate_func):
+                return _pack_translate(texts, _translate_func)
             engine_name = "googletrans (Fallback)"
             print(f"✓ Using googletrans (fallback)")
             if progress_callback:
@@ -113,140 +362,350 @@ def translate_texts(slides_data: List[Dict], target_lang: str, progress_callback
         )
         raise Exception(error_msg)
 
-    translated_slides = []
     total_slides = len(slides_data)
 
-    for slide in slides_data:
-        try:
-            # CRITICAL FIX: Use ai_narration if available, otherwise fall back to text
-            text_to_translate = slide.get('ai_narration', '') or slide.get('text', '')
+    # Single pass: collect every non-empty string (main text + blocks) into one
+    # flat list, so the whole deck is translated in a few batched API calls
+    # instead of one round-trip per slide/block.
+    translated_slides = []
+    texts = []      # flat list of source strings
+    index_map = []  # parallel list of (slide_idx, 'text' | 'block', block_idx)
+    target_base = target_lang.split('-')[0].lower()  # 'zh-CN' -> 'zh'
 
-            # Store original text separately
-            original_text = slide.get('text', '')
+    for slide_idx, slide in enumerate(slides_data):
+        # CRITICAL FIX: Use ai_narration if available, otherwise fall back to text
+        text_to_translate = slide.get('ai_narration', '') or slide.get('text', '')
 
-            if text_to_translate.strip():
-                # Translate main text with retry
-                max_retries = 3
-                translated_text = None
+        translated_slide = TranslatedSlide(slide_number=slide.get('slide_number', slide_idx + 1))
+        translated_slides.append(translated_slide)
 
-                for attempt in range(max_retries):
-                    try:
-                        status_msg = f'[{engine_name}] Translating: Slide {slide["slide_number"]}/{total_slides}'
-                        if attempt > 0:
-                            status_msg += f' (retry {attempt}/{max_retries})'
-
-                        print(status_msg)
-                        if progress_callback:
-                            progress_callback(status_msg)
-
-                        translated_text = translate_func(text_to_translate)
-
-                        success_msg = f'✓ Slide {slide["slide_number"]}/{total_slides} completed'
-                        print(success_msg)
-                        if progress_callback:
-                            progress_callback(success_msg)
-                        break
-
-                    except Exception as retry_error:
-                        if attempt < max_retries - 1:
-                            wait_time = (attempt + 1) * 2
-                            error_msg = f"✗ Slide {slide['slide_number']} attempt {attempt + 1} failed. Retrying in {wait_time}s..."
-                            print(f"{error_msg} Error: {str(retry_error)}")
-                            if progress_callback:
-                                progress_callback(error_msg)
-                            time.sleep(wait_time)
-                        else:
-                            print(f"✗✗ Slide {slide['slide_number']} all attempts failed!")
-                            raise retry_error
-
-                if translated_text is None or not translated_text.strip():
-                    raise Exception("Translation result returned empty or None")
-
-                # Translate individual blocks if they exist
-                translated_blocks = []
-                if slide.get('text_blocks'):
-                    for block_idx, block in enumerate(slide['text_blocks']):
-                        if block.strip():
-                            block_translated = None
-                            for attempt in range(max_retries):
-                                try:
-                                    block_translated = translate_func(block)
-                                    break
-                                except Exception as retry_error:
-                                    if attempt < max_retries - 1:
-                                        time.sleep((attempt + 1) * 1)
-                                    else:
-                                        print(f"Block {block_idx + 1} translation failed: {str(retry_error)}")
-                                        raise retry_error
-                            translated_blocks.append(block_translated if block_translated else '')
-                        else:
-                            translated_blocks.append('')
-
-                translated_slide = slide.copy()
-                translated_slide['original_text'] = original_text  # Keep original extracted text
-                translated_slide['translated_text'] = translated_text  # Translated AI narration
-                translated_slide['translated_blocks'] = translated_blocks
-                translated_slides.append(translated_slide)
-
-                print(f"Slide {slide['slide_number']} translated: {translated_text[:50]}...")
-
-                # Rate limiting
-                if engine_name == "DeepL (Premium)":
-                    time.sleep(0.1)
-                else:
-                    time.sleep(0.5)
+        if not text_to_translate.strip():
+            continue  # Empty slide, nothing to enqueue
 
-                if progress_callback:
-                    progress_callback(f'Slide {slide["slide_number"]}/{total_slides} processed')
+        blocks = slide.get('text_blocks') or []
+
+        # Pure numbers/punctuation would only get corrupted by translation
+        if _NON_TRANSLATABLE_RE.match(text_to_translate):
+            translated_slide.translated_text = text_to_translate
+            translated_slide.translated_blocks = list(blocks)
+            continue
+
+        # Skip the round-trip when the slide is already in the target language
+        if LANGDETECT_AVAILABLE:
+            try:
+                if _get_langdetect().detect(text_to_translate[:512]) == target_base:
+                    translated_slide.translated_text = text_to_translate
+                    translated_slide.translated_blocks = list(blocks)
+                    continue
+            except Exception:
+                pass  # Detection failed — translate normally
+
+        if blocks and text_to_translate == '\n'.join(blocks):
+            # The slide text IS the joined blocks (no AI narration), so
+            # translating both would do the same work twice. Translate the
+            # sentinel-joined blocks once and derive text + blocks from it.
+            translated_slide.translated_blocks = [''] * len(blocks)
+            texts.append(_PACK_SEP.join(blocks))
+            index_map.append((slide_idx, 'joined', None))
+            continue
+
+        texts.append(text_to_translate)
+        index_map.append((slide_idx, 'text', None))
+
+        # Enqueue individual blocks if they exist (empty blocks stay '')
+        if blocks:
+            translated_slide.translated_blocks = [''] * len(blocks)
+            for block_idx, block in enumerate(blocks):
+                if not block.strip():
+                    continue
+                if _NON_TRANSLATABLE_RE.match(block):
+                    translated_slide.translated_blocks[block_idx] = block
+                    continue
+                texts.append(block)
+                index_map.append((slide_idx, 'block', block_idx))
+
+    # Positions in index_map belonging to each slide, so we know when every
+    # text a slide depends on has been resolved and the slide can be yielded
+    slide_positions = [[] for _ in slides_data]
+    for i, (slide_idx, _, _) in enumerate(index_map):
+        slide_positions[slide_idx].append(i)
+
+    # Deduplicate repeated strings (headers, footers, identical bullets) so
+    # each unique source text hits the API at most once. Duplicates become a
+    # dict lookup during the scatter phase instead of a network call.
+    cache = {}
+    text_positions = {}  # source text -> positions in index_map (for error flagging)
+    unique_texts = []
+    for i, text in enumerate(texts):
+        if text not in cache:
+            cache[text] = None
+            unique_texts.append(text)
+        text_positions.setdefault(text, []).append(i)
+
+    # Consult the persistent cache first; only misses go to the API
+    cache_conn = _open_translation_cache()
+    if cache_conn is not None and unique_texts:
+        remaining = []
+        for text in unique_texts:
+            row = cache_conn.execute(
+                "SELECT translation FROM translations WHERE key=?",
+                (_cache_key(engine_name, target_lang, text),)
+            ).fetchone()
+            if row is not None:
+                cache[text] = row[0]
             else:
-                # Empty slide
-                translated_slide = slide.copy()
-                translated_slide['original_text'] = original_text
-                translated_slide['translated_text'] = ''
-                translated_slide['translated_blocks'] = []
-                translated_slides.append(translated_slide)
+                remaining.append(text)
+        hits = len(unique_texts) - len(remaining)
+        if hits:
+            print(f"✓ Translation cache: {hits}/{len(unique_texts)} texts reused from disk")
+        unique_texts = remaining
+
+    # Chunk the unique texts to respect provider batch caps
+    # (DeepL accepts at most 50 texts / 76 KiB per request)
+    MAX_BATCH_TEXTS = 50
+    MAX_BATCH_BYTES = 76 * 1024
+
+    chunks = []
+    current_chunk = []
+    current_bytes = 0
+    for text in unique_texts:
+        text_bytes = len(text.encode('utf-8'))
+        if current_chunk and (len(current_chunk) >= MAX_BATCH_TEXTS
+                              or current_bytes + text_bytes > MAX_BATCH_BYTES):
+            chunks.append(current_chunk)
+            current_chunk = []
+            current_bytes = 0
+        current_chunk.append(text)
+        current_bytes += text_bytes
+    if current_chunk:
+        chunks.append(current_chunk)
+
+    # Backoff grows geometrically, so more attempts are affordable
+    max_retries = 5
+    total_chunks = len(chunks)
+
+    # DeepL tolerates more concurrent calls than the free Google endpoints
+    max_workers = 8 if engine_name == "DeepL (Premium)" else 4
+    rate_limiter = TokenBucket(*RATE_LIMITS.get(engine_name, (1, 0.33)))
+
+    def _translate_chunk(chunk_idx, chunk):
+        """Translate one chunk with retries; returns the translated list or None."""
+        # Retry around each chunk, not each string
+        for attempt in range(max_retries):
+            try:
+                status_msg = f'[{engine_name}] Translating: Batch {chunk_idx + 1}/{total_chunks} ({len(chunk)} texts)'
+                if attempt > 0:
+                    status_msg += f' (retry {attempt}/{max_retries})'
 
-        except Exception as e:
-            import traceback
-            error_msg = f"Error translating Slide {slide['slide_number']}: {str(e)}"
-            print(error_msg)
-            print(f"Detailed error: {traceback.format_exc()}")
+                print(status_msg)
+                if progress_callback:
+                    progress_callback(status_msg)
 
-            if progress_callback:
-                progress_callback(f"✗ Error on slide {slide['slide_number']}: {str(e)}")
+                # Blocks only when the engine's quota is actually exhausted
+                rate_limiter.acquire()
+
+                chunk_result = translate_batch_func(chunk)
 
-            translated_slide = slide.copy()
-            translated_slide['original_text'] = slide.get('text', '')
-            translated_slide['translated_text'] = ''
-            translated_slide['translated_blocks'] = []
-            translated_slide['translation_error'] = str(e)
-            translated_slides.append(translated_slide)
+                success_msg = f'✓ Batch {chunk_idx + 1}/{total_chunks} completed'
+                print(success_msg)
+                if progress_callback:
+                    progress_callback(success_msg)
+                return chunk_result
+
+            except Exception as retry_error:
+                if _classify_error(retry_error) == 'fatal':
+                    # Auth/quota problems hit every batch equally — abort the
+                    # whole run instead of retrying each one into the ground
+                    logger.error(f"✗✗ Fatal translation error (not retrying): {str(retry_error)}")
+                    if progress_callback:
+                        progress_callback(f"✗ Fatal translation error: {str(retry_error)}")
+                    raise
+                if attempt < max_retries - 1:
+                    # Full-jitter exponential backoff: concurrent workers
+                    # spread out instead of re-colliding on a fixed tick
+                    wait_time = random.uniform(0, min(30, 1.5 * (2 ** attempt)))
+                    error_text = str(retry_error).lower()
+                    if '429' in error_text or 'too many requests' in error_text:
+                        # Deplete the bucket so other workers stop piling on
+                        rate_limiter.drain()
+                    error_msg = f"✗ Batch {chunk_idx + 1} attempt {attempt + 1} failed. Retrying in {wait_time:.1f}s..."
+                    print(f"{error_msg} Error: {str(retry_error)}")
+                    if progress_callback:
+                        progress_callback(error_msg)
+                    time.sleep(wait_time)
+                else:
+                    logger.error(f"✗✗ Batch {chunk_idx + 1} all attempts failed: {str(retry_error)}")
+                    if DEBUG:
+                        logger.error(traceback.format_exc())
+                    if progress_callback:
+                        progress_callback(f"✗ Error on batch {chunk_idx + 1}: {str(retry_error)}")
+                    # Flag every slide that references a text in this chunk
+                    for text in chunk:
+                        for i in text_positions[text]:
+                            slide_idx = index_map[i][0]
+                            translated_slides[slide_idx].translation_error = str(retry_error)
+                    return None
+
+    def _finalize_slide(slide_idx):
+        """Scatter resolved texts onto the slide's record and return it."""
+        translated_slide = translated_slides[slide_idx]
+
+        for i in slide_positions[slide_idx]:
+            _, kind, block_idx = index_map[i]
+            translated = cache.get(texts[i])
+            if translated is None:
+                continue
+            if kind == 'text':
+                translated_slide.translated_text = translated
+                print(f"Slide {translated_slide.slide_number} translated: {translated[:50]}...")
+            elif kind == 'joined':
+                blocks = slides_data[slide_idx]['text_blocks']
+                parts = [part.strip() for part in translated.split(_PACK_SEP_CORE)]
+                translated_slide.translated_text = '\n'.join(parts)
+                if len(parts) == len(blocks):
+                    translated_slide.translated_blocks = parts
+                else:
+                    # Sentinel didn't survive translation — redo the blocks
+                    # individually for this slide only (through the dedup cache)
+                    try:
+                        redone = []
+                        for block in blocks:
+                            block_translated = cache.get(block)
+                            if block_translated is None:
+                                block_translated = translate_func(block)
+                                cache[block] = block_translated
+                            redone.append(block_translated)
+                        translated_slide.translated_blocks = redone
+                    except Exception as block_error:
+                        print(f"Block re-translation failed for Slide "
+                              f"{translated_slide.slide_number}: {str(block_error)}")
+                        translated_slide.translation_error = str(block_error)
+                print(f"Slide {translated_slide.slide_number} translated: "
+                      f"{translated_slide.translated_text[:50]}...")
+            else:
+                translated_slide.translated_blocks[block_idx] = translated
+
+        # Flag a non-empty slide whose main text still came back empty
+        text_to_translate = (slides_data[slide_idx].get('ai_narration', '')
+                             or slides_data[slide_idx].get('text', ''))
+        if (text_to_translate.strip()
+                and not translated_slide.translated_text.strip()
+                and translated_slide.translation_error is None):
+            translated_slide.translation_error = "Translation result returned empty or None"
+
+        return translated_slide
+
+    # Texts with a final answer (translated, cached, or failed for good).
+    # A slide streams out as soon as every text it references is resolved.
+    resolved = {text for text, translated in cache.items() if translated is not None}
+    next_slide = 0
+
+    def _slide_ready(slide_idx):
+        return all(texts[i] in resolved for i in slide_positions[slide_idx])
+
+    # Chunks spend almost all their time blocked on HTTPS, so run up to
+    # max_workers of them concurrently; completed slides are yielded in
+    # slide order while later chunks are still in flight.
+    if chunks:
+        with ThreadPoolExecutor(max_workers=min(max_workers, total_chunks)) as executor:
+            futures = {executor.submit(_translate_chunk, chunk_idx, chunk): chunk_idx
+                       for chunk_idx, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                chunk = chunks[futures[future]]
+                try:
+                    chunk_result = future.result()
+                except Exception:
+                    # Fatal error from a worker: drop the queued batches and
+                    # surface it to the caller immediately
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                if chunk_result is not None:
+                    for src_text, translated in zip(chunk, chunk_result):
+                        cache[src_text] = translated
+                resolved.update(chunk)
+
+                while next_slide < total_slides and _slide_ready(next_slide):
+                    yield _finalize_slide(next_slide)
+                    next_slide += 1
+
+    # Flush the rest (cache-only runs, empty/skipped slides, failed chunks)
+    while next_slide < total_slides:
+        yield _finalize_slide(next_slide)
+        next_slide += 1
+
+    # Persist the new translations in one batched write (single commit,
+    # not one fsync per slide)
+    if cache_conn is not None:
+        try:
+            new_rows = [(_cache_key(engine_name, target_lang, text), cache[text])
+                        for text in unique_texts if cache[text] is not None]
+            if new_rows:
+                cache_conn.executemany(
+                    "INSERT OR REPLACE INTO translations (key, translation) VALUES (?, ?)",
+                    new_rows
+                )
+                cache_conn.commit()
+        except Exception as e:
+            print(f"⚠ Could not persist translation cache: {e}")
+        finally:
+            cache_conn.close()
 
-    success_count = sum(1 for s in translated_slides if s.get('translated_text'))
+    success_count = sum(1 for s in translated_slides if s.translated_text)
     summary = f"Translation complete: {success_count}/{total_slides} slides translated using {engine_name}"
     print(summary)
     if progress_callback:
         progress_callback(summary)
 
-    return translated_slides
+
+def translate_texts(slides_data: List[Dict], target_lang: str, progress_callback=None) -> List[TranslatedSlide]:
+    """
+    List-returning wrapper around iter_translate_texts for callers that want
+    the whole deck at once; streaming callers should iterate
+    iter_translate_texts directly.
+    """
+    return list(iter_translate_texts(slides_data, target_lang, progress_callback))
+
+
+async def translate_texts_async(slides_data: List[Dict], target_lang: str, progress_callback=None) -> List[TranslatedSlide]:
+    """
+    Async variant of translate_texts for event-loop callers (e.g. the Flet UI).
+
+    The translator backends shipped here (deepl, deep-translator, googletrans)
+    only expose synchronous HTTP clients, so the blocking batch pipeline is
+    pushed onto a worker thread with asyncio.to_thread instead of being
+    rewritten on aiohttp. Concurrency across batches is already bounded by
+    the engine-sized thread pool inside translate_texts.
+    """
+    return await asyncio.to_thread(translate_texts, slides_data, target_lang, progress_callback)
+
+
+# Long-lived clients for translate_single_text: rebuilding one per call
+# throws away the authenticated session and its warm connection pool
+_deepl_client = None
+_deep_translator_clients = {}  # target_lang -> GoogleTranslator
 
 
 def translate_single_text(text: str, target_lang: str) -> str:
     """Translates a single piece of text."""
+    global _deepl_client
     try:
         if DEEPL_AVAILABLE:
             api_key = get_deepl_api_key()
             if api_key:
-                translator = deepl.Translator(api_key)
-                result = translator.translate_text(text, target_lang=target_lang.upper())
+                if _deepl_client is None:
+                    _deepl_client = _get_deepl().Translator(api_key)
+                result = _deepl_client.translate_text(text, target_lang=target_lang.upper())
                 return result.text
 
         if DEEP_TRANSLATOR_AVAILABLE:
-            translator = GoogleTranslator(source='auto', target=target_lang)
+            translator = _deep_translator_clients.get(target_lang)
+            if translator is None:
+                translator = _get_deep_translator().GoogleTranslator(source='auto', target=target_lang)
+                _deep_translator_clients[target_lang] = translator
             return translator.translate(text)
 
         if GOOGLETRANS_AVAILABLE:
-            translator = Translator()
+            translator = _get_googletrans().Translator()
             return translator.translate(text, dest=target_lang).text
 
         raise Exception("No translation module available.")
@@ -278,4 +737,5 @@ def check_translation_services():
     print("=" * 40 + "\n")
 
 
-check_translation_services()
\ No newline at end of file
+if __name__ == "__main__":
+    check_translation_services()
\ No newline at end of file